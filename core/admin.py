@@ -1,7 +1,9 @@
 from django.contrib import admin
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.forms import ModelForm
-from .models import PricingConfig, ConfigurationLog
+from .models import PricingConfig, ConfigurationLog, normalize_applicable_days
+from .tasks import enqueue_config_logs
 
 class PricingConfigForm(ModelForm):
     class Meta:
@@ -9,15 +11,10 @@ class PricingConfigForm(ModelForm):
         fields = '__all__'
 
     def clean_applicable_days(self):
-        days = self.cleaned_data['applicable_days']
-        try:
-            day_list = [int(d.strip()) for d in days.split(',')]
-            for day in day_list:
-                if day not in range(7):
-                    raise ValidationError(f"Invalid day number: {day}. Must be between 0 and 6.")
-            return ','.join(str(d) for d in sorted(day_list))
-        except ValueError:
+        days = normalize_applicable_days(self.cleaned_data['applicable_days'])
+        if days is None:
             raise ValidationError("Days must be comma-separated numbers between 0 and 6")
+        return days
 
     def clean(self):
         cleaned_data = super().clean()
@@ -66,16 +63,31 @@ class PricingConfigAdmin(admin.ModelAdmin):
     )
 
     def save_model(self, request, obj, form, change):
-        super().save_model(request, obj, form, change)
-        
-        # Log the configuration change
-        action = 'UPDATE' if change else 'CREATE'
-        ConfigurationLog.objects.create(
-            config=obj,
-            action=action,
-            actor=request.user,
-            changes=form.changed_data
-        )
+        # The admin views already run inside a transaction; savepoint=False
+        # joins it instead of paying for a SAVEPOINT/RELEASE pair and only
+        # opens a transaction when save_model is called on its own.
+        with transaction.atomic(savepoint=False):
+            super().save_model(request, obj, form, change)
+            
+            # Log the configuration change. Entries are collected per request
+            # and handed to a background worker once the admin transaction
+            # commits, so the INSERT stays off the response path.
+            action = 'UPDATE' if change else 'CREATE'
+            log = ConfigurationLog(
+                config=obj,
+                action=action,
+                actor=request.user,
+                changes=form.changed_data
+            )
+            pending_logs = getattr(request, '_pending_config_logs', None)
+            if pending_logs is not None:
+                pending_logs.append(log)
+                return
+            request._pending_config_logs = [log]
+            transaction.on_commit(lambda: self._flush_config_logs(request))
+
+    def _flush_config_logs(self, request):
+        enqueue_config_logs(request.__dict__.pop('_pending_config_logs', []))
 
 class ConfigurationLogAdmin(admin.ModelAdmin):
     list_display = ('config', 'action', 'actor', 'timestamp')
@@ -83,6 +95,9 @@ class ConfigurationLogAdmin(admin.ModelAdmin):
     search_fields = ('config__name', 'actor__username')
     readonly_fields = ('config', 'action', 'actor', 'timestamp', 'changes')
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('config', 'actor')
+
     def has_add_permission(self, request):
         return False
 
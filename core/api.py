@@ -1,27 +1,120 @@
+import hashlib
+import json
+import math
+import time
+from decimal import Decimal
+from functools import wraps
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework import serializers
+from django.db.models import F
 from django.utils import timezone
-from decimal import Decimal
-from .models import PricingConfig, ConfigurationLog
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from .models import PricingConfig, ConfigurationLog, normalize_applicable_days
+from .signals import active_configs_version
+
+# (epoch second, weekday) of the last _current_weekday() call
+_weekday_cache = [None, 0]
+
+def _current_weekday():
+    """Return timezone.now().weekday(), recomputed at most once per second"""
+    second = int(time.time())
+    if _weekday_cache[0] != second:
+        _weekday_cache[:] = [second, timezone.now().weekday()]
+    return _weekday_cache[1]
+
+# The browsable API page for the same URL shows the logged-in user, so only
+# the JSON representation of a documentation payload is tagged and shared
+def _static_payload_etag(payload):
+    """Return an etag_func for a payload that only changes between deploys"""
+    digest = hashlib.md5(json.dumps(payload, sort_keys=True).encode(), usedforsecurity=False).hexdigest()
+    return lambda request, *args, **kwargs: digest if request.accepted_renderer.format == 'json' else None
+
+def _cache_static_payload(method):
+    """Let clients and proxies cache a documentation payload's JSON for a day"""
+    @wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        response = method(self, request, *args, **kwargs)
+        if request.accepted_renderer.format == 'json':
+            patch_cache_control(response, public=True, max_age=86400)
+        else:
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+    return wrapper
+
+# Upper bound, in seconds, on how long a process keeps pricing with a config
+# that changed without a signal reaching it (another worker, a management
+# command, QuerySet.update())
+ACTIVE_CONFIGS_CACHE_TTL = 5
+
+# day of week -> (version, expires at, configs)
+_active_configs_cache = {}
+
+# Clock for the cache expiry, kept separate so tests can move it on its own
+_monotonic = time.monotonic
+
+def _get_configs_for_day(day):
+    """
+    Return the active configuration applicable on a day of week as a
+    zero- or one-item tuple, cached in-process until a config changes
+    or ACTIVE_CONFIGS_CACHE_TTL passes
+    """
+    version = active_configs_version[0]
+    now = _monotonic()
+    entry = _active_configs_cache.get(day)
+    if entry is None or entry[0] != version or entry[1] <= now:
+        entry = (version, now + ACTIVE_CONFIGS_CACHE_TTL, _query_configs_for_day(day))
+        _active_configs_cache[day] = entry
+    return entry[2]
+
+def _query_configs_for_day(day):
+    queryset = PricingConfig.objects.alias(
+        day_bit=F('applicable_days_mask').bitand(1 << day)
+    ).filter(is_active=True, day_bit__gt=0).order_by('pk')[:1]
+    return tuple(
+        {
+            'id': config.id,
+            'name': config.name,
+            'base_price': config.base_price,
+            'base_distance': config.base_distance,
+            'additional_km_price': config.additional_km_price,
+            'time_multipliers': (
+                config.time_multiplier_1,
+                config.time_multiplier_2,
+                config.time_multiplier_3,
+            ),
+            'free_waiting_time': config.free_waiting_time,
+            'waiting_charge_per_min': config.waiting_charge_per_min,
+        }
+        for config in queryset
+    )
 
 class PricingConfigSerializer(serializers.ModelSerializer):
     class Meta:
         model = PricingConfig
-        fields = '__all__'
+        # applicable_days_mask is an internal lookup column derived from applicable_days
+        exclude = ['applicable_days_mask']
         
     def validate_applicable_days(self, value):
         """Validate that applicable_days contains valid day numbers (0-6)"""
-        try:
-            days = [int(d.strip()) for d in value.split(',')]
-            for day in days:
-                if day < 0 or day > 6:
-                    raise serializers.ValidationError("Days must be between 0-6 (Monday=0, Sunday=6)")
-            return value
-        except ValueError:
-            raise serializers.ValidationError("Invalid format for applicable_days")
+        days = normalize_applicable_days(value)
+        if days is None:
+            raise serializers.ValidationError("Days must be comma-separated numbers between 0-6 (Monday=0, Sunday=6)")
+        return days
+
+def _validate_finite(value):
+    """Reject NaN and infinity, which FloatField accepts but JSON can't render"""
+    if not math.isfinite(value):
+        raise serializers.ValidationError("A finite number is required.")
+
+class CalculatePriceInputSerializer(serializers.Serializer):
+    distance = serializers.FloatField(min_value=0, validators=[_validate_finite])  # in kilometers
+    duration = serializers.FloatField(min_value=0, validators=[_validate_finite])  # in minutes
+    waiting_time = serializers.FloatField(min_value=0, validators=[_validate_finite])  # in minutes
 
 class ConfigurationLogSerializer(serializers.ModelSerializer):
     class Meta:
@@ -45,7 +138,7 @@ class PricingConfigViewSet(viewsets.ModelViewSet):
         config = self.get_object()
         config.is_active = True
         config.save()
-        return Response({'status': 'activated'})
+        return Response({'status': 'activated', 'config': self.get_serializer(config).data})
     
     @action(detail=True, methods=['post'])
     def deactivate(self, request, pk=None):
@@ -53,12 +146,41 @@ class PricingConfigViewSet(viewsets.ModelViewSet):
         config = self.get_object()
         config.is_active = False
         config.save()
-        return Response({'status': 'deactivated'})
+        return Response({'status': 'deactivated', 'config': self.get_serializer(config).data})
 
 class ConfigurationLogViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = ConfigurationLog.objects.all()
     serializer_class = ConfigurationLogSerializer
 
+_CALCULATE_PRICE_DOC_PAYLOAD = {
+    "endpoint": "/api/calculate-price/",
+    "method": "POST",
+    "description": "Calculate ride price based on distance, duration, and waiting time",
+    "required_parameters": {
+        "distance": "Distance in kilometers (decimal)",
+        "duration": "Duration in minutes (decimal)", 
+        "waiting_time": "Waiting time in minutes (decimal)"
+    },
+    "example_request": {
+        "distance": 5.5,
+        "duration": 45,
+        "waiting_time": 5
+    },
+    "example_response": {
+        "price": 450.75,
+        "breakdown": {
+            "base_price": 80.00,
+            "distance_price": 155.00,
+            "time_multiplier": 1.25,
+            "waiting_charges": 10.00
+        },
+        "config_used": {
+            "name": "Weekday Standard",
+            "id": 1
+        }
+    }
+}
+
 class CalculatePriceView(APIView):
     """
     Calculate price based on distance, duration, and waiting time.
@@ -89,37 +211,26 @@ class CalculatePriceView(APIView):
     """
     
     def get_active_config(self, day_of_week):
-        configs = PricingConfig.objects.filter(is_active=True)
-        for config in configs:
-            applicable_days = [int(d) for d in config.applicable_days.split(',')]
-            if day_of_week in applicable_days:
-                return config
-        return None
+        configs = _get_configs_for_day(day_of_week)
+        return configs[0] if configs else None
 
     def calculate_time_multiplier(self, config, duration_hours):
-        if duration_hours <= 1:
-            return config.time_multiplier_1
-        elif duration_hours <= 2:
-            return config.time_multiplier_2
-        else:
-            return config.time_multiplier_3
+        # First hour, second hour, third hour onwards
+        tier = 2 if duration_hours > 2 else (1 if duration_hours > 1 else 0)
+        return config['time_multipliers'][tier]
 
     def post(self, request):
-        try:
-            # Get required parameters
-            distance = Decimal(str(request.data.get('distance', 0)))  # in kilometers
-            duration = Decimal(str(request.data.get('duration', 0)))  # in minutes
-            waiting_time = Decimal(str(request.data.get('waiting_time', 0)))  # in minutes
-            
-            # Validate input
-            if distance < 0 or duration < 0 or waiting_time < 0:
-                return Response(
-                    {"error": "Distance, duration, and waiting time must be non-negative"},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+        # Validate input
+        serializer = CalculatePriceInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        # Money arithmetic is done in Decimal; floats are only for the response
+        distance = Decimal(str(serializer.validated_data['distance']))
+        duration = Decimal(str(serializer.validated_data['duration']))
+        waiting_time = Decimal(str(serializer.validated_data['waiting_time']))
 
+        try:
             # Get current day of week (0 = Monday, 6 = Sunday)
-            current_day = timezone.now().weekday()
+            current_day = _current_weekday()
             
             # Get active pricing configuration for current day
             config = self.get_active_config(current_day)
@@ -130,37 +241,37 @@ class CalculatePriceView(APIView):
                 )
 
             # Calculate base price
-            if distance <= config.base_distance:
-                distance_price = config.base_price
+            if distance <= config['base_distance']:
+                distance_price = config['base_price']
             else:
-                additional_distance = distance - config.base_distance
-                distance_price = config.base_price + (additional_distance * config.additional_km_price)
+                additional_distance = distance - config['base_distance']
+                distance_price = config['base_price'] + (additional_distance * config['additional_km_price'])
 
             # Calculate time multiplier
             duration_hours = duration / 60  # Convert minutes to hours
             time_multiplier = self.calculate_time_multiplier(config, duration_hours)
             
             # Calculate waiting charges
-            if waiting_time <= config.free_waiting_time:
+            if waiting_time <= config['free_waiting_time']:
                 waiting_charges = Decimal('0')
             else:
-                billable_waiting_time = waiting_time - config.free_waiting_time
-                waiting_charges = billable_waiting_time * config.waiting_charge_per_min
+                billable_waiting_time = waiting_time - config['free_waiting_time']
+                waiting_charges = billable_waiting_time * config['waiting_charge_per_min']
 
             # Calculate final price
             final_price = (distance_price * time_multiplier) + waiting_charges
 
             return Response({
-                "price": round(final_price, 2),
+                "price": float(round(final_price, 2)),
                 "breakdown": {
-                    "base_price": float(config.base_price),
-                    "distance_price": float(distance_price),
+                    "base_price": float(config['base_price']),
+                    "distance_price": float(round(distance_price, 2)),
                     "time_multiplier": float(time_multiplier),
-                    "waiting_charges": float(waiting_charges)
+                    "waiting_charges": float(round(waiting_charges, 2))
                 },
                 "config_used": {
-                    "name": config.name,
-                    "id": config.id
+                    "name": config['name'],
+                    "id": config['id']
                 },
                 "calculation_details": {
                     "input": {
@@ -172,70 +283,44 @@ class CalculatePriceView(APIView):
                 }
             })
 
-        except (ValueError, TypeError):
-            return Response(
-                {"error": "Invalid input format"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
         except Exception as e:
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    @_cache_static_payload
+    @method_decorator(condition(etag_func=_static_payload_etag(_CALCULATE_PRICE_DOC_PAYLOAD)))
     def get(self, request):
         """
         Get API documentation for the calculate-price endpoint
         """
-        return Response({
-            "endpoint": "/api/calculate-price/",
-            "method": "POST",
-            "description": "Calculate ride price based on distance, duration, and waiting time",
-            "required_parameters": {
-                "distance": "Distance in kilometers (decimal)",
-                "duration": "Duration in minutes (decimal)", 
-                "waiting_time": "Waiting time in minutes (decimal)"
-            },
-            "example_request": {
-                "distance": 5.5,
-                "duration": 45,
-                "waiting_time": 5
-            },
-            "example_response": {
-                "price": 450.75,
-                "breakdown": {
-                    "base_price": 80.00,
-                    "distance_price": 155.00,
-                    "time_multiplier": 1.25,
-                    "waiting_charges": 10.00
-                },
-                "config_used": {
-                    "name": "Weekday Standard",
-                    "id": 1
-                }
-            }
-        })
+        return Response(_CALCULATE_PRICE_DOC_PAYLOAD)
+
+_API_ROOT_PAYLOAD = {
+    "message": "Pricing Module API",
+    "version": "1.0",
+    "endpoints": {
+        "calculate_price": "/api/calculate-price/",
+        "pricing_configs": "/api/pricing-configs/",
+        "configuration_logs": "/api/configuration-logs/",
+        "active_configs": "/api/pricing-configs/active/",
+        "admin": "/admin/",
+        "api_root": "/api/"
+    },
+    "documentation": {
+        "calculate_price": "POST to calculate ride price",
+        "pricing_configs": "CRUD operations for pricing configurations",
+        "configuration_logs": "View configuration change history",
+        "active_configs": "Get all active pricing configurations"
+    }
+}
 
 class APIRootView(APIView):
     """
     API Root - Lists all available endpoints
     """
+    @_cache_static_payload
+    @method_decorator(condition(etag_func=_static_payload_etag(_API_ROOT_PAYLOAD)))
     def get(self, request):
-        return Response({
-            "message": "Pricing Module API",
-            "version": "1.0",
-            "endpoints": {
-                "calculate_price": "/api/calculate-price/",
-                "pricing_configs": "/api/pricing-configs/",
-                "configuration_logs": "/api/configuration-logs/",
-                "active_configs": "/api/pricing-configs/active/",
-                "admin": "/admin/",
-                "api_root": "/api/"
-            },
-            "documentation": {
-                "calculate_price": "POST to calculate ride price",
-                "pricing_configs": "CRUD operations for pricing configurations",
-                "configuration_logs": "View configuration change history",
-                "active_configs": "Get all active pricing configurations"
-            }
-        }) 
\ No newline at end of file
+        return Response(_API_ROOT_PAYLOAD) 
\ No newline at end of file
@@ -1,14 +1,13 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from decimal import Decimal
-from core.models import PricingConfig
+from core.models import PricingConfig, applicable_days_to_mask
+from core.signals import invalidate_active_configs_cache
 
 class Command(BaseCommand):
     help = 'Populate sample pricing configurations for testing'
 
     def handle(self, *args, **options):
-        # Clear existing configs
-        PricingConfig.objects.all().delete()
-        
         # Create sample configurations
         configs = [
             {
@@ -65,10 +64,22 @@ class Command(BaseCommand):
             }
         ]
         
-        created_count = 0
-        for config_data in configs:
-            config = PricingConfig.objects.create(**config_data)
-            created_count += 1
+        # bulk_create skips save() and post_save, so fill in the mask and
+        # invalidate this process's active config cache by hand; a running
+        # server picks the new configs up within ACTIVE_CONFIGS_CACHE_TTL
+        with transaction.atomic():
+            # Clear existing configs
+            PricingConfig.objects.all().delete()
+            created = PricingConfig.objects.bulk_create([
+                PricingConfig(
+                    **config_data,
+                    applicable_days_mask=applicable_days_to_mask(config_data['applicable_days'])
+                )
+                for config_data in configs
+            ])
+        invalidate_active_configs_cache()
+        
+        for config in created:
             self.stdout.write(
                 self.style.SUCCESS(
                     f'Created pricing config: {config.name} ({"Active" if config.is_active else "Inactive"})'
@@ -76,16 +87,18 @@ class Command(BaseCommand):
             )
         
         self.stdout.write(
-            self.style.SUCCESS(f'Successfully created {created_count} pricing configurations')
+            self.style.SUCCESS(f'Successfully created {len(created)} pricing configurations')
         )
         
         # Display summary
         self.stdout.write('\n--- Sample Data Summary ---')
-        active_configs = PricingConfig.objects.filter(is_active=True)
-        self.stdout.write(f'Active configurations: {active_configs.count()}')
+        active_configs = list(
+            PricingConfig.objects.filter(is_active=True).only('name', 'applicable_days')
+        )
+        self.stdout.write(f'Active configurations: {len(active_configs)}')
         
+        days_map = {0: 'Mon', 1: 'Tue', 2: 'Wed', 3: 'Thu', 4: 'Fri', 5: 'Sat', 6: 'Sun'}
         for config in active_configs:
-            days_map = {0: 'Mon', 1: 'Tue', 2: 'Wed', 3: 'Thu', 4: 'Fri', 5: 'Sat', 6: 'Sun'}
             applicable_days = [days_map[int(d)] for d in config.applicable_days.split(',')]
             self.stdout.write(f'  - {config.name}: {", ".join(applicable_days)}')
         
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.1 on 2026-10-15 21:27
+
+from django.db import migrations, models
+
+
+def populate_applicable_days_mask(apps, schema_editor):
+    PricingConfig = apps.get_model('core', 'PricingConfig')
+    for config in PricingConfig.objects.all():
+        mask = 0
+        for day in config.applicable_days.split(','):
+            mask |= 1 << int(day)
+        config.applicable_days_mask = mask
+        config.save(update_fields=['applicable_days_mask'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pricingconfig',
+            name='applicable_days_mask',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, help_text='Bitmask of applicable_days (bit 0 is Monday), kept in sync on save'),
+        ),
+        migrations.RunPython(populate_applicable_days_mask, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='pricingconfig',
+            index=models.Index(fields=['is_active', 'applicable_days_mask'], name='core_pricin_is_acti_95bbdb_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-15 21:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_pricingconfig_applicable_days_mask'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='configurationlog',
+            index=models.Index(fields=['config', '-timestamp'], name='core_config_config__7f494a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='configurationlog',
+            index=models.Index(fields=['timestamp'], name='core_config_timesta_cc2716_idx'),
+        ),
+    ]
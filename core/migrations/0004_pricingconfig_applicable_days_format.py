@@ -0,0 +1,32 @@
+# Generated by Django 5.2.1 on 2026-10-15 21:30
+
+from django.db import migrations, models
+
+
+def normalize_applicable_days(apps, schema_editor):
+    # The API and admin used to store anything int() accepted per day, such as
+    # "0, 1", "01,2" or "+1", as-is
+    PricingConfig = apps.get_model('core', 'PricingConfig')
+    for config in PricingConfig.objects.all():
+        days = ','.join(str(day) for day in sorted({int(d) for d in config.applicable_days.split(',')}))
+        if days != config.applicable_days:
+            config.applicable_days = days
+            config.save(update_fields=['applicable_days'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_configurationlog_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_applicable_days, migrations.RunPython.noop),
+        # On SQLite, __regex compiles to REGEXP(), which only Django's connections
+        # define; raw sqlite3 clients writing applicable_days must register it
+        # themselves (see README, Day Configuration).
+        migrations.AddConstraint(
+            model_name='pricingconfig',
+            constraint=models.CheckConstraint(condition=models.Q(('applicable_days__regex', '^[0-6](,[0-6])*$')), name='pricingconfig_applicable_days_format', violation_error_message='Days must be comma-separated numbers between 0 and 6'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-15 21:31
+
+import core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_pricingconfig_applicable_days_format'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='configurationlog',
+            name='changes',
+            field=models.JSONField(default=list, encoder=core.models.CompactJSONEncoder),
+        ),
+    ]
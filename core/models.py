@@ -1,7 +1,26 @@
+import json
+import re
 from django.db import models
 from django.core.validators import MinValueValidator
 from django.contrib.auth.models import User
 
+APPLICABLE_DAYS_REGEX = r'^[0-6](,[0-6])*$'
+_APPLICABLE_DAYS_RE = re.compile(APPLICABLE_DAYS_REGEX)
+
+def normalize_applicable_days(value):
+    """Return value as sorted distinct comma-separated days, or None if it is malformed"""
+    value = value.replace(' ', '')
+    if not _APPLICABLE_DAYS_RE.fullmatch(value):
+        return None
+    return ','.join(sorted(set(value.split(','))))
+
+def applicable_days_to_mask(applicable_days):
+    """Convert comma-separated days of week (0-6) to a 7-bit mask, Monday is bit 0"""
+    mask = 0
+    for day in applicable_days.split(','):
+        mask |= 1 << int(day)
+    return mask
+
 class PricingConfig(models.Model):
     DAYS_OF_WEEK = [
         (0, 'Monday'),
@@ -75,6 +94,14 @@ class PricingConfig(models.Model):
         max_length=13,  # 7 days + 6 commas
         help_text="Comma-separated days of week (0-6, Monday is 0)"
     )
+    # Only save() keeps this in sync. bulk_create() and QuerySet.update() of
+    # applicable_days skip it, and a stale mask hides the config from price
+    # lookups, so those paths must set it with applicable_days_to_mask().
+    applicable_days_mask = models.PositiveSmallIntegerField(
+        default=0,
+        editable=False,
+        help_text="Bitmask of applicable_days (bit 0 is Monday), kept in sync on save"
+    )
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -82,9 +109,32 @@ class PricingConfig(models.Model):
     def __str__(self):
         return f"{self.name} ({'Active' if self.is_active else 'Inactive'})"
 
+    def save(self, *args, **kwargs):
+        self.applicable_days_mask = applicable_days_to_mask(self.applicable_days)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'applicable_days' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'applicable_days_mask'}
+        super().save(*args, **kwargs)
+
     class Meta:
         verbose_name = "Pricing Configuration"
         verbose_name_plural = "Pricing Configurations"
+        indexes = [
+            models.Index(fields=['is_active', 'applicable_days_mask']),
+        ]
+        constraints = [
+            # REGEXP() on SQLite, which raw sqlite3 connections lack (see README)
+            models.CheckConstraint(
+                condition=models.Q(applicable_days__regex=APPLICABLE_DAYS_REGEX),
+                name='pricingconfig_applicable_days_format',
+                violation_error_message="Days must be comma-separated numbers between 0 and 6",
+            ),
+        ]
+
+class CompactJSONEncoder(json.JSONEncoder):
+    """JSON encoder that omits the spaces after item and key separators"""
+    item_separator = ','
+    key_separator = ':'
 
 class ConfigurationLog(models.Model):
     ACTION_CHOICES = [
@@ -97,7 +147,8 @@ class ConfigurationLog(models.Model):
     action = models.CharField(max_length=6, choices=ACTION_CHOICES)
     actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     timestamp = models.DateTimeField(auto_now_add=True)
-    changes = models.JSONField(default=dict)
+    # Names of the fields changed by the admin form
+    changes = models.JSONField(default=list, encoder=CompactJSONEncoder)
 
     def __str__(self):
         return f"{self.action} by {self.actor} at {self.timestamp}"
@@ -105,3 +156,7 @@ class ConfigurationLog(models.Model):
     class Meta:
         verbose_name = "Configuration Log"
         verbose_name_plural = "Configuration Logs"
+        indexes = [
+            models.Index(fields=['config', '-timestamp']),
+            models.Index(fields=['timestamp']),
+        ]
@@ -0,0 +1,22 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import PricingConfig
+
+# Bumped whenever a PricingConfig changes; part of the active config cache key
+active_configs_version = [0]
+
+
+def invalidate_active_configs_cache():
+    """Make the next active config lookup in this process go to the database"""
+    active_configs_version[0] += 1
+
+
+@receiver(post_save, sender=PricingConfig)
+@receiver(post_delete, sender=PricingConfig)
+def pricing_config_changed(sender, **kwargs):
+    # Invalidate again once the change is visible to other connections, so a
+    # lookup racing with the open transaction cannot cache the old rows
+    invalidate_active_configs_cache()
+    transaction.on_commit(invalidate_active_configs_cache)
@@ -0,0 +1,26 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections
+
+from .models import ConfigurationLog
+
+logger = logging.getLogger(__name__)
+
+# A single worker keeps log writes ordered and off the request thread
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='config-log')
+
+
+def write_config_logs(logs):
+    """Insert queued ConfigurationLog entries; runs on the background worker"""
+    try:
+        ConfigurationLog.objects.bulk_create(logs)
+    except Exception:
+        logger.exception("Failed to write %d configuration log entries", len(logs))
+    finally:
+        connections.close_all()
+
+
+def enqueue_config_logs(logs):
+    """Schedule logs to be written without blocking the caller"""
+    return _executor.submit(write_config_logs, logs)
@@ -1,13 +1,67 @@
-from django.test import TestCase
-from django.urls import reverse
-from rest_framework.test import APITestCase
+import time
+from io import StringIO
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.urls import reverse, reverse_lazy
+from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
 from decimal import Decimal
-from .models import PricingConfig, ConfigurationLog
+from .admin import PricingConfigForm
+from .api import ACTIVE_CONFIGS_CACHE_TTL, _get_configs_for_day
+from .models import PricingConfig, ConfigurationLog, applicable_days_to_mask
+from .signals import invalidate_active_configs_cache
+from .tasks import enqueue_config_logs
 
-class PricingConfigModelTest(TestCase):
+CALCULATE_PRICE_URL = reverse_lazy('calculate_price')
+
+# (name, payload, expected price) against CalculatePriceAPITest's config
+CALCULATE_PRICE_CASES = (
+    # base_price(50) + additional_distance(1*15) = 65, no waiting charges
+    ('basic', {'distance': 3.0, 'duration': 30, 'waiting_time': 2}, 65.0),
+    # Exactly base distance: base_price(50) + waiting_charges(5*5) = 75
+    ('waiting_charges', {'distance': 2.0, 'duration': 30, 'waiting_time': 8}, 75.0),
+    # 1.5 hours: base_price(50) * time_multiplier_2(1.25) = 62.5
+    ('time_multiplier_2', {'distance': 2.0, 'duration': 90, 'waiting_time': 0}, 62.5),
+    # 2.5 hours: base_price(50) * time_multiplier_3(2.2) = 110
+    ('time_multiplier_3', {'distance': 2.0, 'duration': 150, 'waiting_time': 0}, 110.0),
+    # Half-cent results round to the even cent: 50 + 0.003*15 = 50.045, 50 + 0.005*15 = 50.075
+    ('half_cent_down', {'distance': 2.003, 'duration': 30, 'waiting_time': 0}, 50.04),
+    ('half_cent_up', {'distance': 2.005, 'duration': 30, 'waiting_time': 0}, 50.08),
+)
+
+# (name, payload) that stay within PricingCalculationEdgeCasesTest's base price
+BASE_PRICE_ONLY_CASES = (
+    ('exact_base_distance', {'distance': 5.0, 'duration': 30, 'waiting_time': 0}),
+    ('zero_values', {'distance': 0, 'duration': 0, 'waiting_time': 0}),
+)
+
+class SharedClientAPITestCase(APITestCase):
+    """
+    Base for API tests that don't change client state (auth, cookies).
+    Requests go through one client per class, which builds its middleware
+    chain once instead of on every test's fresh self.client.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.shared_client = APIClient()
+
+class CalculatePriceTestCase(SharedClientAPITestCase):
+    """Base for tests that POST to the calculate-price endpoint"""
+    url = CALCULATE_PRICE_URL
+
+    def setUp(self):
+        # Rolling back a test's changes doesn't send post_save, so drop
+        # whatever the previous test left in the active config cache
+        invalidate_active_configs_cache()
+
+class PricingConfigModelTest(SimpleTestCase):
     def setUp(self):
-        self.config = PricingConfig.objects.create(
+        # An unsaved instance; none of these tests touch the database
+        self.config = PricingConfig(
             name="Test Config",
             base_distance=Decimal('2.0'),
             base_price=Decimal('50.0'),
@@ -30,9 +84,10 @@ class PricingConfigModelTest(TestCase):
         expected = "Test Config (Active)"
         self.assertEqual(str(self.config), expected)
 
-class CalculatePriceAPITest(APITestCase):
-    def setUp(self):
-        self.config = PricingConfig.objects.create(
+class PricingConfigPersistenceTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.config = PricingConfig.objects.create(
             name="Test Config",
             base_distance=Decimal('2.0'),
             base_price=Decimal('50.0'),
@@ -42,52 +97,157 @@ class CalculatePriceAPITest(APITestCase):
             time_multiplier_3=Decimal('2.2'),
             free_waiting_time=3,
             waiting_charge_per_min=Decimal('5.0'),
-            applicable_days="0,1,2,3,4,5,6",  # All days
+            applicable_days="0,1,2,3,4",  # Monday to Friday
             is_active=True
         )
-        self.url = reverse('calculate_price')
 
-    def test_calculate_price_basic(self):
-        """Test basic price calculation"""
-        data = {
-            'distance': 3.0,
-            'duration': 30,
-            'waiting_time': 2
-        }
-        response = self.client.post(self.url, data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
-        # Expected: base_price(50) + additional_distance(1*15) = 65, no waiting charges
-        expected_price = 65.0
-        self.assertEqual(response.data['price'], expected_price)
+    def test_configuration_log_changes_stored_compactly(self):
+        log = ConfigurationLog.objects.create(
+            config=self.config, action='UPDATE', changes=['name', 'base_price']
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT changes FROM core_configurationlog WHERE id = %s", [log.id])
+            self.assertEqual(cursor.fetchone()[0], '["name","base_price"]')
+
+    def test_applicable_days_check_constraint(self):
+        with self.assertRaises(IntegrityError):
+            PricingConfig.objects.filter(pk=self.config.pk).update(applicable_days='0,7')
+
+    def test_applicable_days_mask(self):
+        self.assertEqual(self.config.applicable_days_mask, 0b0011111)
+        self.config.applicable_days = "5,6"
+        self.config.save(update_fields=['applicable_days'])
+        self.config.refresh_from_db()
+        self.assertEqual(self.config.applicable_days_mask, 0b1100000)
 
-    def test_calculate_price_with_waiting_charges(self):
-        """Test price calculation with waiting charges"""
+class PricingConfigFormTest(TestCase):
+    def test_clean_applicable_days(self):
+        """Test applicable_days is normalised and out of range days rejected"""
         data = {
-            'distance': 2.0,  # Exactly base distance
-            'duration': 30,
-            'waiting_time': 8  # 5 minutes over free waiting time
+            'name': 'Form Config',
+            'is_active': True,
+            'base_distance': '2.0',
+            'base_price': '50.0',
+            'additional_km_price': '15.0',
+            'time_multiplier_1': '1.0',
+            'time_multiplier_2': '1.25',
+            'time_multiplier_3': '2.2',
+            'free_waiting_time': 3,
+            'waiting_charge_per_min': '5.0',
+            'applicable_days': '4, 0,2,0',
         }
-        response = self.client.post(self.url, data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
-        # Expected: base_price(50) + waiting_charges(5*5) = 75
-        expected_price = 75.0
-        self.assertEqual(response.data['price'], expected_price)
+        form = PricingConfigForm(data=data)
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data['applicable_days'], '0,2,4')
+
+        for invalid in ('7', '0,,1', 'mon', '1,'):
+            form = PricingConfigForm(data={**data, 'applicable_days': invalid})
+            self.assertFalse(form.is_valid())
+            self.assertIn('applicable_days', form.errors)
 
-    def test_calculate_price_with_time_multiplier(self):
-        """Test price calculation with time multiplier"""
+class PricingConfigAdminTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_save_logs_change_on_commit(self):
+        """Test saving through the admin queues a configuration log after commit"""
         data = {
-            'distance': 2.0,
-            'duration': 90,  # 1.5 hours - should use time_multiplier_2
-            'waiting_time': 0
+            'name': 'Admin Config',
+            'is_active': 'on',
+            'base_distance': '2.0',
+            'base_price': '50.0',
+            'additional_km_price': '15.0',
+            'time_multiplier_1': '1.0',
+            'time_multiplier_2': '1.25',
+            'time_multiplier_3': '2.2',
+            'free_waiting_time': 3,
+            'waiting_charge_per_min': '5.0',
+            'applicable_days': '0,1,2',
         }
-        response = self.client.post(self.url, data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
-        # Expected: base_price(50) * time_multiplier_2(1.25) = 62.5
-        expected_price = 62.5
-        self.assertEqual(response.data['price'], expected_price)
+        with mock.patch('core.admin.enqueue_config_logs') as enqueue:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(reverse('admin:core_pricingconfig_add'), data)
+                self.assertFalse(enqueue.called)
+        self.assertEqual(response.status_code, 302)
+
+        enqueue.assert_called_once()
+        [log] = enqueue.call_args.args[0]
+        self.assertEqual(log.action, 'CREATE')
+        self.assertEqual(log.actor, self.user)
+        self.assertEqual(log.config.name, 'Admin Config')
+
+class ConfigurationLogTaskTest(TransactionTestCase):
+    # The logs are written on the worker thread's own connection, so the
+    # config has to be committed for it to see
+    def test_enqueued_logs_are_written(self):
+        """Test the background worker persists queued configuration logs"""
+        config = PricingConfig.objects.create(
+            name="Logged Config",
+            base_distance=Decimal('2.0'),
+            base_price=Decimal('50.0'),
+            additional_km_price=Decimal('15.0'),
+            time_multiplier_1=Decimal('1.0'),
+            time_multiplier_2=Decimal('1.25'),
+            time_multiplier_3=Decimal('2.2'),
+            free_waiting_time=3,
+            waiting_charge_per_min=Decimal('5.0'),
+            applicable_days="0,1,2,3,4",
+            is_active=True
+        )
+        logs = [
+            ConfigurationLog(config=config, action='CREATE', changes=['name']),
+            ConfigurationLog(config=config, action='UPDATE', changes=['base_price']),
+        ]
+        enqueue_config_logs(logs).result()
+
+        self.assertQuerySetEqual(
+            ConfigurationLog.objects.filter(config=config).order_by('id'),
+            [('CREATE', ['name']), ('UPDATE', ['base_price'])],
+            transform=lambda log: (log.action, log.changes)
+        )
+
+class PopulateSampleDataCommandTest(TestCase):
+    def test_populate_sample_data(self):
+        """Test the bulk-created sample configs get masks and are found by price lookups"""
+        call_command('populate_sample_data', stdout=StringIO())
+
+        configs = PricingConfig.objects.all()
+        self.assertEqual(len(configs), 4)
+        for config in configs:
+            with self.subTest(config.name):
+                self.assertEqual(config.applicable_days_mask, applicable_days_to_mask(config.applicable_days))
+
+        self.assertEqual(_get_configs_for_day(0)[0]['name'], 'Weekday Standard')
+        self.assertEqual(_get_configs_for_day(5)[0]['name'], 'Weekend Premium')
+
+class CalculatePriceAPITest(CalculatePriceTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.config = PricingConfig.objects.create(
+            name="Test Config",
+            base_distance=Decimal('2.0'),
+            base_price=Decimal('50.0'),
+            additional_km_price=Decimal('15.0'),
+            time_multiplier_1=Decimal('1.0'),
+            time_multiplier_2=Decimal('1.25'),
+            time_multiplier_3=Decimal('2.2'),
+            free_waiting_time=3,
+            waiting_charge_per_min=Decimal('5.0'),
+            applicable_days="0,1,2,3,4,5,6",  # All days
+            is_active=True
+        )
+
+    def test_calculate_price(self):
+        """Test price calculation across distance, waiting time and duration tiers"""
+        for name, data, expected_price in CALCULATE_PRICE_CASES:
+            with self.subTest(name):
+                response = self.shared_client.post(self.url, data, format='json')
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data['price'], expected_price)
 
     def test_calculate_price_invalid_input(self):
         """Test validation of negative values"""
@@ -96,32 +256,93 @@ class CalculatePriceAPITest(APITestCase):
             'duration': 30,
             'waiting_time': 5
         }
-        response = self.client.post(self.url, data, format='json')
+        response = self.shared_client.post(self.url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('distance', response.data)
+
+    def test_calculate_price_non_finite_input(self):
+        """Test NaN and infinite values are rejected rather than priced"""
+        for value in ('nan', 'inf', '1e400'):
+            with self.subTest(value):
+                data = {'distance': value, 'duration': 30, 'waiting_time': 5}
+                response = self.shared_client.post(self.url, data, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('distance', response.data)
+
+    def test_calculate_price_missing_and_malformed_input(self):
+        """Test missing or non-numeric parameters are rejected per field"""
+        data = {'distance': 'far', 'duration': 30}
+        response = self.shared_client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('distance', response.data)
+        self.assertIn('waiting_time', response.data)
+        self.assertNotIn('duration', response.data)
 
     def test_calculate_price_no_active_config(self):
         """Test error when no active config exists"""
-        self.config.is_active = False
-        self.config.save()
+        PricingConfig.objects.filter(pk=self.config.pk).update(is_active=False)
         
         data = {
             'distance': 5.0,
             'duration': 30,
             'waiting_time': 5
         }
-        response = self.client.post(self.url, data, format='json')
+        response = self.shared_client.post(self.url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_first_matching_config_is_used(self):
+        """Test the oldest active config wins when several apply to the same day"""
+        PricingConfig.objects.create(
+            name="Later Config",
+            base_distance=Decimal('2.0'),
+            base_price=Decimal('90.0'),
+            additional_km_price=Decimal('15.0'),
+            free_waiting_time=3,
+            waiting_charge_per_min=Decimal('5.0'),
+            applicable_days="0,1,2,3,4,5,6",
+            is_active=True
+        )
+        data = {'distance': 2.0, 'duration': 30, 'waiting_time': 0}
+        response = self.shared_client.post(self.url, data, format='json')
+        self.assertEqual(response.data['config_used']['id'], self.config.id)
+
+    def test_active_config_is_cached(self):
+        """Test repeated calculations reuse the cached config until it changes"""
+        data = {'distance': 2.0, 'duration': 30, 'waiting_time': 0}
+        self.shared_client.post(self.url, data, format='json')
+        with self.assertNumQueries(0):
+            response = self.shared_client.post(self.url, data, format='json')
+        self.assertEqual(response.data['price'], 50.0)
+
+        self.config.base_price = Decimal('70.0')
+        self.config.save()
+        response = self.shared_client.post(self.url, data, format='json')
+        self.assertEqual(response.data['price'], 70.0)
+
+    def test_active_config_cache_expires(self):
+        """Test changes that send no signal are picked up once the cache expires"""
+        data = {'distance': 2.0, 'duration': 30, 'waiting_time': 0}
+        self.shared_client.post(self.url, data, format='json')
+        PricingConfig.objects.filter(pk=self.config.pk).update(base_price=Decimal('70.0'))
+        response = self.shared_client.post(self.url, data, format='json')
+        self.assertEqual(response.data['price'], 50.0)
+
+        expired = time.monotonic() + ACTIVE_CONFIGS_CACHE_TTL
+        with mock.patch('core.api._monotonic', return_value=expired):
+            response = self.shared_client.post(self.url, data, format='json')
+        self.assertEqual(response.data['price'], 70.0)
+
     def test_get_api_documentation(self):
         """Test GET request returns API documentation"""
-        response = self.client.get(self.url)
+        response = self.shared_client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('endpoint', response.data)
         self.assertIn('example_request', response.data)
 
-class PricingConfigAPITest(APITestCase):
-    def setUp(self):
-        self.config = PricingConfig.objects.create(
+class PricingConfigAPITest(SharedClientAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.config = PricingConfig.objects.create(
             name="Test Config",
             base_distance=Decimal('2.0'),
             base_price=Decimal('50.0'),
@@ -138,9 +359,11 @@ class PricingConfigAPITest(APITestCase):
     def test_list_pricing_configs(self):
         """Test listing all pricing configurations"""
         url = reverse('pricingconfig-list')
-        response = self.client.get(url)
+        with self.assertNumQueries(1):
+            response = self.shared_client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
+        self.assertNotIn('applicable_days_mask', response.data[0])
 
     def test_create_pricing_config(self):
         """Test creating a new pricing configuration"""
@@ -158,66 +381,128 @@ class PricingConfigAPITest(APITestCase):
             'applicable_days': '5,6',  # Saturday, Sunday
             'is_active': True
         }
-        response = self.client.post(url, data, format='json')
+        response = self.shared_client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(PricingConfig.objects.count(), 2)
 
+        data['applicable_days'] = '6, 5'
+        response = self.shared_client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['applicable_days'], '5,6')
+
+        data['applicable_days'] = '1-5'
+        response = self.shared_client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_get_active_configs(self):
         """Test getting only active configurations"""
-        # Create an inactive config
-        PricingConfig.objects.create(
-            name="Inactive Config",
-            base_distance=Decimal('1.0'),
-            base_price=Decimal('40.0'),
-            additional_km_price=Decimal('10.0'),
-            time_multiplier_1=Decimal('1.0'),
-            time_multiplier_2=Decimal('1.0'),
-            time_multiplier_3=Decimal('1.0'),
-            free_waiting_time=2,
-            waiting_charge_per_min=Decimal('3.0'),
-            applicable_days="0,1,2,3,4",
-            is_active=False
-        )
+        # Create an inactive config; bulk_create skips save() and the cache
+        # signals, so the mask is filled in as populate_sample_data does
+        PricingConfig.objects.bulk_create([
+            PricingConfig(
+                name="Inactive Config",
+                base_distance=Decimal('1.0'),
+                base_price=Decimal('40.0'),
+                additional_km_price=Decimal('10.0'),
+                time_multiplier_1=Decimal('1.0'),
+                time_multiplier_2=Decimal('1.0'),
+                time_multiplier_3=Decimal('1.0'),
+                free_waiting_time=2,
+                waiting_charge_per_min=Decimal('3.0'),
+                applicable_days="0,1,2,3,4",
+                applicable_days_mask=applicable_days_to_mask("0,1,2,3,4"),
+                is_active=False
+            ),
+        ])
         
         url = reverse('pricingconfig-active')
-        response = self.client.get(url)
+        with self.assertNumQueries(1):
+            response = self.shared_client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)  # Only active config
 
     def test_activate_config(self):
         """Test activating a configuration"""
-        self.config.is_active = False
-        self.config.save()
+        PricingConfig.objects.filter(pk=self.config.pk).update(is_active=False)
         
         url = reverse('pricingconfig-activate', kwargs={'pk': self.config.id})
-        response = self.client.post(url)
+        with self.assertNumQueries(2):  # SELECT + UPDATE
+            response = self.shared_client.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
-        self.config.refresh_from_db()
-        self.assertTrue(self.config.is_active)
+        self.assertTrue(response.data['config']['is_active'])
 
     def test_deactivate_config(self):
         """Test deactivating a configuration"""
         url = reverse('pricingconfig-deactivate', kwargs={'pk': self.config.id})
-        response = self.client.post(url)
+        with self.assertNumQueries(2):  # SELECT + UPDATE
+            response = self.shared_client.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
-        self.config.refresh_from_db()
-        self.assertFalse(self.config.is_active)
+        self.assertFalse(response.data['config']['is_active'])
 
-class APIRootTest(APITestCase):
+class ConfigurationLogAPITest(SharedClientAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user('editor')
+        config = PricingConfig.objects.create(
+            name="Logged Config",
+            base_distance=Decimal('2.0'),
+            base_price=Decimal('50.0'),
+            additional_km_price=Decimal('15.0'),
+            free_waiting_time=3,
+            waiting_charge_per_min=Decimal('5.0'),
+            applicable_days="0,1,2,3,4",
+            is_active=True
+        )
+        ConfigurationLog.objects.bulk_create([
+            ConfigurationLog(config=config, action='CREATE', actor=user, changes=['name']),
+            ConfigurationLog(config=config, action='UPDATE', actor=user, changes=['base_price']),
+            ConfigurationLog(config=config, action='UPDATE', actor=None, changes=['is_active']),
+        ])
+
+    def test_list_configuration_logs(self):
+        """Test listing logs doesn't query per related config or actor"""
+        url = reverse('configurationlog-list')
+        with self.assertNumQueries(1):
+            response = self.shared_client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 3)
+
+class APIRootTest(SharedClientAPITestCase):
     def test_api_root(self):
         """Test API root endpoint returns all available endpoints"""
         url = reverse('api_root')
-        response = self.client.get(url)
+        response = self.shared_client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('endpoints', response.data)
         self.assertIn('calculate_price', response.data['endpoints'])
         self.assertIn('pricing_configs', response.data['endpoints'])
 
-class PricingCalculationEdgeCasesTest(APITestCase):
-    def setUp(self):
-        self.config = PricingConfig.objects.create(
+    def test_api_root_conditional_get(self):
+        """Test API root is cacheable and revalidates with its ETag"""
+        url = reverse('api_root')
+        response = self.shared_client.get(url)
+        self.assertIn('public', response['Cache-Control'])
+        self.assertIn('max-age=86400', response['Cache-Control'])
+        etag = response['ETag']
+
+        response = self.shared_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_api_root_browsable_page_is_not_shared(self):
+        """Test the browsable API page, which shows the logged-in user, is neither shared nor revalidated"""
+        url = reverse('api_root')
+        etag = self.shared_client.get(url)['ETag']
+        response = self.shared_client.get(url, HTTP_IF_NONE_MATCH=etag, HTTP_ACCEPT='text/html')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('ETag', response)
+        self.assertIn('private', response['Cache-Control'])
+        self.assertIn('no-cache', response['Cache-Control'])
+        self.assertNotIn('public', response['Cache-Control'])
+
+class PricingCalculationEdgeCasesTest(CalculatePriceTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.config = PricingConfig.objects.create(
             name="Edge Case Config",
             base_distance=Decimal('5.0'),
             base_price=Decimal('100.0'),
@@ -230,26 +515,19 @@ class PricingCalculationEdgeCasesTest(APITestCase):
             applicable_days="0,1,2,3,4,5,6",
             is_active=True
         )
-        self.url = reverse('calculate_price')
 
-    def test_exact_base_distance(self):
-        """Test calculation when distance exactly equals base distance"""
-        data = {'distance': 5.0, 'duration': 30, 'waiting_time': 0}
-        response = self.client.post(self.url, data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['price'], 100.0)  # Exactly base price
-
-    def test_zero_values(self):
-        """Test calculation with zero values"""
-        data = {'distance': 0, 'duration': 0, 'waiting_time': 0}
-        response = self.client.post(self.url, data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['price'], 100.0)  # Base price
+    def test_base_price_only(self):
+        """Test calculations that stay within the base price"""
+        for name, data in BASE_PRICE_ONLY_CASES:
+            with self.subTest(name):
+                response = self.shared_client.post(self.url, data, format='json')
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data['price'], 100.0)  # Exactly base price
 
     def test_large_values(self):
         """Test calculation with large values"""
         data = {'distance': 100.0, 'duration': 300, 'waiting_time': 60}
-        response = self.client.post(self.url, data, format='json')
+        response = self.shared_client.post(self.url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertGreater(response.data['price'], 0)
         
@@ -0,0 +1,23 @@
+"""
+Django settings for running the pricing_module test suite.
+
+Used by pytest (see pytest.ini) and by
+`python manage.py test --settings=pricing_module.settings_test`.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+# Keep the test database in memory whatever database the project itself
+# is configured with, so schema creation and test writes never touch disk.
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# The default PBKDF2 hasher is deliberately slow; tests only need users
+# that can log in.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
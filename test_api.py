@@ -6,9 +6,10 @@ This script tests all available API endpoints and demonstrates
 how to use the pricing module APIs.
 
 Usage:
-    python test_api.py
+    python test_api.py [--verbose] [--smoke]
 """
 
+import argparse
 import requests
 import json
 import sys
@@ -17,6 +18,14 @@ from datetime import datetime
 # Configuration
 BASE_URL = "http://localhost:8000"
 API_BASE = f"{BASE_URL}/api"
+CALCULATE_PRICE_URL = f"{API_BASE}/calculate-price/"
+
+# Pretty-print request and response bodies (set by --verbose)
+VERBOSE = False
+
+# One session for the whole run so requests reuse kept-alive connections
+session = requests.Session()
+session.headers['Content-Type'] = 'application/json'
 
 def print_section(title):
     """Print a formatted section header"""
@@ -31,31 +40,30 @@ def print_subsection(title):
 def make_request(method, url, data=None, expected_status=200):
     """Make an API request and handle the response"""
     try:
-        headers = {'Content-Type': 'application/json'}
-        
         if method.upper() == 'GET':
-            response = requests.get(url, headers=headers)
+            response = session.get(url)
         elif method.upper() == 'POST':
-            response = requests.post(url, json=data, headers=headers)
+            response = session.post(url, json=data)
         elif method.upper() == 'PUT':
-            response = requests.put(url, json=data, headers=headers)
+            response = session.put(url, json=data)
         elif method.upper() == 'DELETE':
-            response = requests.delete(url, headers=headers)
+            response = session.delete(url)
         else:
             print(f"Unsupported method: {method}")
             return None
         
         print(f"{method.upper()} {url}")
-        if data:
+        if VERBOSE and data:
             print(f"Request data: {json.dumps(data, indent=2)}")
         
         print(f"Status: {response.status_code}")
         
-        try:
-            response_data = response.json()
-            print(f"Response: {json.dumps(response_data, indent=2)}")
-        except:
-            print(f"Response text: {response.text}")
+        if VERBOSE:
+            try:
+                response_data = response.json()
+                print(f"Response: {json.dumps(response_data, indent=2)}")
+            except:
+                print(f"Response text: {response.text}")
         
         if response.status_code != expected_status:
             print(f"⚠️  Expected status {expected_status}, got {response.status_code}")
@@ -88,7 +96,7 @@ def test_calculate_price():
         "duration": 45,
         "waiting_time": 5
     }
-    make_request('POST', f"{API_BASE}/calculate-price/", data)
+    make_request('POST', CALCULATE_PRICE_URL, data)
     
     # Test 2: Edge case - exact base distance
     print_subsection("Edge Case - Exact Base Distance")
@@ -97,7 +105,7 @@ def test_calculate_price():
         "duration": 30,
         "waiting_time": 0
     }
-    make_request('POST', f"{API_BASE}/calculate-price/", data)
+    make_request('POST', CALCULATE_PRICE_URL, data)
     
     # Test 3: Long duration with time multiplier
     print_subsection("Long Duration with Time Multiplier")
@@ -106,7 +114,7 @@ def test_calculate_price():
         "duration": 150,  # 2.5 hours
         "waiting_time": 15
     }
-    make_request('POST', f"{API_BASE}/calculate-price/", data)
+    make_request('POST', CALCULATE_PRICE_URL, data)
     
     # Test 4: Invalid input (negative values)
     print_subsection("Invalid Input Test")
@@ -115,11 +123,11 @@ def test_calculate_price():
         "duration": 30,
         "waiting_time": 5
     }
-    make_request('POST', f"{API_BASE}/calculate-price/", data, expected_status=400)
+    make_request('POST', CALCULATE_PRICE_URL, data, expected_status=400)
     
     # Test 5: Get documentation
     print_subsection("API Documentation")
-    make_request('GET', f"{API_BASE}/calculate-price/")
+    make_request('GET', CALCULATE_PRICE_URL)
 
 def test_pricing_configs():
     """Test pricing configuration endpoints"""
@@ -177,7 +185,7 @@ def test_admin_interface():
     """Test admin interface accessibility"""
     print_section("ADMIN INTERFACE TEST")
     try:
-        response = requests.get(f"{BASE_URL}/admin/")
+        response = session.get(f"{BASE_URL}/admin/")
         print(f"GET {BASE_URL}/admin/")
         print(f"Status: {response.status_code}")
         if response.status_code == 200:
@@ -192,41 +200,35 @@ def run_performance_test():
     print_section("PERFORMANCE TEST")
     print("Running 10 concurrent price calculations...")
     
+    import statistics
     import time
-    import threading
+    from concurrent.futures import ThreadPoolExecutor
     
-    results = []
+    # Every request sends the same payload, so encode it once
+    body = json.dumps({
+        "distance": 5.0,
+        "duration": 40,
+        "waiting_time": 3
+    }).encode()
     
     def single_request():
-        data = {
-            "distance": 5.0,
-            "duration": 40,
-            "waiting_time": 3
-        }
         start_time = time.time()
-        response = requests.post(f"{API_BASE}/calculate-price/", json=data)
+        response = session.post(CALCULATE_PRICE_URL, data=body)
         end_time = time.time()
-        results.append({
+        return {
             'status': response.status_code,
             'time': end_time - start_time
-        })
-    
-    # Run 10 concurrent requests
-    threads = []
-    start_time = time.time()
-    
-    for i in range(10):
-        thread = threading.Thread(target=single_request)
-        threads.append(thread)
-        thread.start()
-    
-    for thread in threads:
-        thread.join()
+        }
     
-    total_time = time.time() - start_time
+    # Run 10 concurrent requests over the shared keep-alive session
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        start_time = time.time()
+        futures = [executor.submit(single_request) for _ in range(10)]
+        results = [future.result() for future in futures]
+        total_time = time.time() - start_time
     
-    successful_requests = len([r for r in results if r['status'] == 200])
-    avg_response_time = sum(r['time'] for r in results) / len(results)
+    successful_requests = sum(1 for r in results if r['status'] == 200)
+    avg_response_time = statistics.fmean(r['time'] for r in results)
     
     print(f"Total requests: 10")
     print(f"Successful requests: {successful_requests}")
@@ -236,6 +238,13 @@ def run_performance_test():
 
 def main():
     """Main test runner"""
+    global VERBOSE
+    parser = argparse.ArgumentParser(description="Test the pricing module API against a running server")
+    parser.add_argument('--verbose', action='store_true', help="print request and response bodies")
+    parser.add_argument('--smoke', action='store_true', help="also check the admin interface is reachable")
+    args = parser.parse_args()
+    VERBOSE = args.verbose
+    
     print(f"Pricing Module API Testing Script")
     print(f"Testing server at: {BASE_URL}")
     print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -245,7 +254,8 @@ def main():
     test_calculate_price()
     test_pricing_configs()
     test_configuration_logs()
-    test_admin_interface()
+    if args.smoke:
+        test_admin_interface()
     
     # Performance test
     try: